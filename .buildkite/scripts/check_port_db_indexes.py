@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2020 The Matrix.org Foundation C.I.C.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Helper for testing 'synapse_port_db --drop-indexes'.
+#
+# With "interrupt", drops an index on the ported PostgreSQL database and records it in
+# 'port_from_sqlite3_indexes', as if a port run with '--drop-indexes' had been killed
+# before it could rebuild the index.
+#
+# With "check", fails if any dropped index is still waiting to be rebuilt, or if the
+# index dropped by "interrupt" hasn't been recreated.
+
+import sys
+
+from synapse.storage.engines import create_engine
+
+INDEX_NAME = "events_order_room"
+
+if __name__ == "__main__":
+    db_engine = create_engine({"name": "psycopg2", "args": {}})
+
+    db_conn = db_engine.module.connect(
+        user="postgres", host="postgres", password="postgres", dbname="synapse"
+    )
+    cur = db_conn.cursor()
+
+    if sys.argv[1] == "interrupt":
+        cur.execute(
+            "SELECT tablename, indexdef FROM pg_indexes WHERE indexname = %s",
+            (INDEX_NAME,),
+        )
+        table_name, definition = cur.fetchone()
+        cur.execute(
+            "INSERT INTO port_from_sqlite3_indexes (index_name, table_name, definition)"
+            " VALUES (%s, %s, %s)",
+            (INDEX_NAME, table_name, definition),
+        )
+        cur.execute("DROP INDEX %s" % (INDEX_NAME,))
+        db_conn.commit()
+    else:
+        cur.execute("SELECT index_name FROM port_from_sqlite3_indexes")
+        leftover = [row[0] for row in cur.fetchall()]
+        if leftover:
+            sys.exit("Indexes were not rebuilt: %s" % (", ".join(leftover),))
+
+        cur.execute("SELECT 1 FROM pg_indexes WHERE indexname = %s", (INDEX_NAME,))
+        if cur.fetchone() is None:
+            sys.exit("Index %s was not recreated" % (INDEX_NAME,))
+
+    cur.close()
+    db_conn.close()
@@ -4,7 +4,8 @@
 # with additional dependencies needed for the test (such as coverage or the PostgreSQL
 # driver), update the schema of the test SQLite database and run background updates on it,
 # create an empty test database in PostgreSQL, then run the 'synapse_port_db' script to
-# test porting the SQLite database to the PostgreSQL database (with coverage).
+# test porting the SQLite database to the PostgreSQL database (with coverage). The port is
+# then run a second time with '--drop-indexes', after simulating an interrupted run.
 
 set -xe
 cd `dirname $0`/../..
@@ -34,3 +35,16 @@ echo "+++ Run synapse_port_db"
 
 # Run the script
 coverage run scripts/synapse_port_db --sqlite-database .buildkite/test_db.db --postgres-config .buildkite/postgres-config.yaml
+
+echo "--- Simulate an interrupted port with --drop-indexes"
+
+# Drop an index and record it as waiting to be rebuilt, as if an earlier run with
+# --drop-indexes had been killed part way through.
+python .buildkite/scripts/check_port_db_indexes.py interrupt
+
+echo "+++ Run synapse_port_db --drop-indexes"
+
+# Run the script again, dropping and rebuilding the indexes on every table it has to
+# copy into, then check that none were left behind.
+coverage run scripts/synapse_port_db --sqlite-database .buildkite/test_db.db --postgres-config .buildkite/postgres-config.yaml --drop-indexes
+python .buildkite/scripts/check_port_db_indexes.py check
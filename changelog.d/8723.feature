@@ -0,0 +1 @@
+Speed up `synapse_port_db`, and add `--parallel-tables`, `--postgres-pool-size` and `--drop-indexes` options to it. `synchronous_commit` now defaults to off while porting.